@@ -207,6 +207,90 @@ def fetch_weekly_avg_data():
         return None
 
 
+# Sections that can be requested from fetch_summary_data
+SUMMARY_FIELDS = ["latest", "daily", "weekly", "hourly", "thresholds"]
+
+
+# Fetch latest values, daily/weekly/hourly averages and thresholds together.
+# The sensor table is scanned once and every aggregate is built in the same
+# pass; thresholds are read once. Only the requested sections are computed.
+def fetch_summary_data(fields=None):
+    if fields is None:
+        fields = SUMMARY_FIELDS
+
+    summary = {}
+    sensor_fields = [f for f in fields if f != "thresholds"]
+
+    if sensor_fields:
+        sensor_data = fetch_sensor_data()
+
+        today = datetime.now(pytz.timezone("Europe/Helsinki")).date()
+        one_week_ago = today - timedelta(days=7)
+
+        daily_totals = {"temperature": 0.0, "humidity": 0.0, "count": 0}
+        weekly_totals = {"temperature": 0.0, "humidity": 0.0, "count": 0}
+        hourly_totals = {}
+
+        for data in sensor_data:
+            timestamp = datetime.strptime(data["timestamp"], "%Y-%m-%d %H:%M:%S")
+            date = timestamp.date()
+
+            if "daily" in fields and date == today:
+                daily_totals["temperature"] += data["temperature"]
+                daily_totals["humidity"] += data["humidity"]
+                daily_totals["count"] += 1
+
+            if "weekly" in fields and date >= one_week_ago:
+                weekly_totals["temperature"] += data["temperature"]
+                weekly_totals["humidity"] += data["humidity"]
+                weekly_totals["count"] += 1
+
+            if "hourly" in fields:
+                hour = timestamp.replace(minute=0, second=0, microsecond=0)
+                if hour not in hourly_totals:
+                    hourly_totals[hour] = {
+                        "temperature": 0.0,
+                        "humidity": 0.0,
+                        "count": 0,
+                    }
+                hourly_totals[hour]["temperature"] += data["temperature"]
+                hourly_totals[hour]["humidity"] += data["humidity"]
+                hourly_totals[hour]["count"] += 1
+
+        if "latest" in fields:
+            # fetch_sensor_data returns the data sorted newest first
+            summary["latest"] = sensor_data[0] if sensor_data else None
+
+        if "daily" in fields:
+            summary["daily"] = _average_totals(daily_totals)
+
+        if "weekly" in fields:
+            summary["weekly"] = _average_totals(weekly_totals)
+
+        if "hourly" in fields:
+            hourly_avg = []
+            for hour in sorted(hourly_totals):
+                averages = _average_totals(hourly_totals[hour])
+                averages["hour"] = hour.strftime("%Y-%m-%d %H:%M:%S")
+                hourly_avg.append(averages)
+            summary["hourly"] = hourly_avg if hourly_avg else None
+
+    if "thresholds" in fields:
+        summary["thresholds"] = fetch_thresholds_from_db()
+
+    return summary
+
+
+# Turn running temperature/humidity sums into averages
+def _average_totals(totals):
+    if not totals["count"]:
+        return None
+    return {
+        "temperature": totals["temperature"] / totals["count"],
+        "humidity": totals["humidity"] / totals["count"],
+    }
+
+
 # fetch_data.py
 def fetch_latest_sensor_data():
     # Fetch all sensor data from the database (as a list of dictionaries)
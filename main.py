@@ -7,10 +7,12 @@ from flask import Flask, jsonify, request
 from flask_socketio import SocketIO, emit
 
 from fetch import (
+    SUMMARY_FIELDS,
     fetch_daily_avg_data,
     fetch_hourly_avg_data,
     fetch_latest_sensor_data,
     fetch_specific_hour_avg_data,
+    fetch_summary_data,
     fetch_thresholds_from_db,
     fetch_weekly_avg_data,
     set_threshold,
@@ -101,6 +103,60 @@ def weekly_averages():
         return jsonify({"error": "No weekly data available"}), 404
 
 
+# Endpoint to get everything the dashboard needs in one request.
+# Sections can be selected with ?fields=latest,daily,weekly,hourly,thresholds
+@app.route("/summary", methods=["GET"])
+def summary():
+    try:
+        fields_param = request.args.get("fields")
+        if fields_param:
+            fields = [f.strip() for f in fields_param.split(",") if f.strip()]
+            invalid = [f for f in fields if f not in SUMMARY_FIELDS]
+            if invalid or not fields:
+                return (
+                    jsonify(
+                        {
+                            "error": f"Invalid fields: {', '.join(invalid)}",
+                            "allowed_fields": SUMMARY_FIELDS,
+                        }
+                    ),
+                    400,
+                )
+        else:
+            fields = SUMMARY_FIELDS
+
+        summary_data = fetch_summary_data(fields)
+
+        if "thresholds" in summary_data and "error" in summary_data["thresholds"]:
+            return jsonify({"error": summary_data["thresholds"]["error"]}), 500
+
+        # Round values the same way as the individual endpoints
+        latest_data = summary_data.get("latest")
+        if latest_data:
+            summary_data["latest"] = {
+                "temperature": round(float(latest_data["temperature"]), 1),
+                "humidity": round(float(latest_data["humidity"]), 1),
+                "timestamp": latest_data["timestamp"],
+            }
+
+        for section in ["daily", "weekly"]:
+            averages = summary_data.get(section)
+            if averages:
+                summary_data[section] = {
+                    "average_temperature": round(averages["temperature"], 1),
+                    "average_humidity": round(averages["humidity"], 1),
+                }
+
+        for hour_data in summary_data.get("hourly") or []:
+            hour_data["temperature"] = round(hour_data["temperature"], 1)
+            hour_data["humidity"] = round(hour_data["humidity"], 1)
+
+        return jsonify(summary_data)
+    except Exception as e:
+        print(f"Error in summary route: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
 @app.route("/set-thresholds", methods=["POST"])
 def set_thresholds():
     try: